@@ -64,7 +64,9 @@ export const createHttpServer = () => {
             const connections = new Set()
             const startTime = Date.now()
 
-            const server = createServer(async (req, res) => {
+            // Disable Nagle for small request/response exchanges and enable
+            // TCP keep-alive so idle peers are detected
+            const server = createServer({ noDelay: true, keepAlive: true }, async (req, res) => {
               try {
                 const reqUrl = new URL(req.url, `http://localhost:${port}`)
                 const path = reqUrl.searchParams.get('path') || reqUrl.pathname
@@ -82,10 +84,13 @@ export const createHttpServer = () => {
                   res.setHeader('Content-Type', 'application/json')
                   res.end(JSON.stringify(result))
                 } else if (req.method === 'PUT' || req.method === 'POST') {
-                  let data = ''
-                  req.on('data', chunk => (data += chunk))
+                  // Collect raw chunks and decode once, so multi-byte characters
+                  // split across chunks survive and large bodies aren't re-copied
+                  const chunks = []
+                  req.on('data', chunk => chunks.push(chunk))
                   req.on('end', async () => {
                     try {
+                      const data = Buffer.concat(chunks).toString('utf8')
                       const reqBody = data ? JSON.parse(data) : undefined
                       // Proxy PUT to kit
                       const result = kit
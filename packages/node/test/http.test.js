@@ -138,6 +138,30 @@ describe('createHttpServer', () => {
       expect(receivedBody).toEqual({ data: 'test' })
     })
 
+    it('decodes large multi-byte PUT bodies intact', async () => {
+      let receivedBody = null
+      const kit = resource({
+        get: async () => ({ headers: {}, body: null }),
+        put: async (h, b) => {
+          receivedBody = b
+          return { headers: {}, body: { received: true } }
+        },
+      })
+
+      await httpServer.put({ path: `/${testPort}`, kit }, {})
+
+      // Large enough to arrive in several chunks, with characters that can straddle them
+      const text = 'héllo wörld ✓ '.repeat(20000)
+      const response = await fetch(`http://localhost:${testPort}/test`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ text }),
+      })
+
+      expect(response.status).toBe(200)
+      expect(receivedBody).toEqual({ text })
+    })
+
     it('proxies POST as PUT to kit', async () => {
       let receivedBody = null
       const kit = resource({
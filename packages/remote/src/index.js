@@ -75,6 +75,11 @@ export function createRemote(options = {}) {
     })
   }
 
+  // Reconstruct the remote path from the bound segment + remaining path
+  function remotePath(h) {
+    return h.path && h.path !== '/' ? '/' + h.params.proxyPath + h.path : '/' + h.params.proxyPath
+  }
+
   return routes({
     '': resource({
       get: async () => ({
@@ -153,17 +158,14 @@ export function createRemote(options = {}) {
               const conn = connections.get(h.params.name)
               if (!conn) return { headers: { condition: 'not-found' }, body: null }
 
-              // Reconstruct the full path from segment + remaining path
-              const fullPath = h.params.proxyPath + (h.path && h.path !== '/' ? h.path : '')
-              return sendRequest(conn, { type: 'get', path: '/' + fullPath })
+              return sendRequest(conn, { type: 'get', path: remotePath(h) })
             },
 
             put: async (h, body) => {
               const conn = connections.get(h.params.name)
               if (!conn) return { headers: { condition: 'not-found' }, body: null }
 
-              const fullPath = h.params.proxyPath + (h.path && h.path !== '/' ? h.path : '')
-              return sendRequest(conn, { type: 'put', path: '/' + fullPath, body })
+              return sendRequest(conn, { type: 'put', path: remotePath(h), body })
             },
           })
         ),